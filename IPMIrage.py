@@ -4,6 +4,11 @@ import csv
 import os
 import subprocess
 import ipaddress
+import socket
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import yaml
@@ -15,6 +20,17 @@ except ImportError:
 import re
 import logging
 from pathlib import Path
+from shutil import which
+
+# Separators and whitespace accepted between MAC address octets
+_MAC_STRIP = re.compile(r'[\s:\-.]')
+# Six hex octets with an optional separator after each of the first five
+_MAC_RE = re.compile(r'([0-9A-Fa-f]{2}[\s:\-.]?){5}[0-9A-Fa-f]{2}')
+# Dotted-quad IPv4 without leading zeros, as accepted by inet_pton
+_IP4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}'
+                     r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])')
+# Error lines printed by ipmitool when a command in a shell session fails
+_IPMI_ERROR_RE = re.compile(r'\b(?:error|failed|invalid|unable)\b', re.IGNORECASE)
 
 # Set up logging
 logging.basicConfig(
@@ -46,28 +62,41 @@ def format_mac_address(mac_address):
     Returns:
         str: Formatted MAC address or None if invalid
     """
-    # Remove all separators and whitespace
-    mac = mac_address.replace(':', '').replace('-', '').replace('.', '').replace(' ', '').upper()
-    
-    # Check if the result is a valid 12-character hex string
-    if len(mac) != 12:
+    # Check for six hex octets with optional separators between them
+    if not _MAC_RE.fullmatch(mac_address.strip()):
         return None
-    
+
+    # Remove all separators and whitespace
+    mac = _MAC_STRIP.sub('', mac_address).upper()
+
+    # Format with colons
+    return ':'.join(mac[i:i+2] for i in range(0, 12, 2))
+
+def _validate_via_pton(ip_address):
+    """Validates an IPv4 or IPv6 address using the system address parser."""
     try:
-        # Verify all characters are valid hex
-        int(mac, 16)
-        
-        # Format with colons
-        formatted_mac = ':'.join(mac[i:i+2] for i in range(0, 12, 2))
-        return formatted_mac
-    except ValueError:
-        # Not a valid hex string
-        return None
+        socket.inet_pton(socket.AF_INET, ip_address)
+        return True
+    except OSError:
+        pass
 
+    try:
+        socket.inet_pton(socket.AF_INET6, ip_address)
+        return True
+    except OSError:
+        return False
+
+@lru_cache(maxsize=1024)
 def validate_ip_address(ip_address):
-    """Validates if the given string is a valid IP address."""
+    """Validates if the given string is a valid IPv4 or IPv6 address."""
+    # Dotted-quad IPv4 is the common case and is fully checked by the regex
+    return _IP4_RE.fullmatch(ip_address) is not None or _validate_via_pton(ip_address)
+
+@lru_cache(maxsize=1024)
+def validate_netmask(netmask):
+    """Validates if the given string is a valid IPv4 netmask or prefix length."""
     try:
-        ipaddress.ip_address(ip_address)
+        ipaddress.IPv4Network(f"0.0.0.0/{netmask}")
         return True
     except ValueError:
         return False
@@ -78,13 +107,13 @@ def setup_eth0_for_dhcp(interface, dhcp_ip):
 
     try:
         # Flush any existing IP
-        subprocess.run(f"sudo ip addr flush dev {interface}", shell=True, check=False)
+        subprocess.run(["sudo", "ip", "addr", "flush", "dev", interface], check=False)
 
         # Assign static IP in the same subnet as the DHCP pool
-        subprocess.run(f"sudo ip addr add {dhcp_ip}/24 dev {interface}", shell=True, check=True)
+        subprocess.run(["sudo", "ip", "addr", "add", f"{dhcp_ip}/24", "dev", interface], check=True)
 
         # Bring the interface up
-        subprocess.run(f"sudo ip link set {interface} up", shell=True, check=True)
+        subprocess.run(["sudo", "ip", "link", "set", interface, "up"], check=True)
 
         logger.info(f"{interface} is now set to {dhcp_ip} and ready to assign IPs.")
     except subprocess.CalledProcessError as e:
@@ -123,9 +152,7 @@ log-dhcp
         sys.exit(1)
 
     # Check if dnsmasq is installed
-    try:
-        subprocess.run(["which", "dnsmasq"], check=True, stdout=subprocess.PIPE)
-    except subprocess.CalledProcessError:
+    if which("dnsmasq") is None:
         logger.error("dnsmasq is not installed. Please install it with: sudo apt-get install dnsmasq")
         sys.exit(1)
 
@@ -137,62 +164,230 @@ log-dhcp
         logger.error(f"Failed to start dnsmasq: {e}")
         sys.exit(1)
 
-def get_dhcp_ip(mac_addr, leases_file):
-    """Find the DHCP-Assigned IP for a given MAC"""
+class _LeaseCache:
+    """Parsed contents of the DHCP leases file, keyed by lowercase MAC address.
+
+    Only the lease watcher in main() reads it, so it needs no locking.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.mapping = {}
+
+_lease_cache = _LeaseCache()
+
+def load_leases(leases_file):
+    """Return a MAC-to-IP mapping of the leases file, re-parsing it only when it changes."""
+    # Include the size: on coarse-timestamp filesystems a rewrite can land in
+    # the same tick as the previous read and leave the mtime unchanged
+    st = os.stat(leases_file)
+    key = (st.st_mtime_ns, st.st_size)
+    if key == _lease_cache.key:
+        return _lease_cache.mapping
+
+    mapping = {}
+    with open(leases_file, "r") as file:
+        for lease in file:
+            parts = lease.split(None, 4)
+            if len(parts) >= 3:
+                mapping[parts[1].lower()] = parts[2]  # Assigned IP
+
+    _lease_cache.key = key
+    _lease_cache.mapping = mapping
+    return mapping
+
+def get_dhcp_leases(leases_file):
+    """Return the current DHCP leases as a mapping of lowercase MAC to assigned IP"""
     try:
         if not os.path.exists(leases_file):
-            logger.warning(f"DHCP leases file not found: {leases_file}")
-            return None
-            
-        with open(leases_file, "r") as file:
-            leases = file.readlines()
+            logger.debug("DHCP leases file not found: %s", leases_file)
+            return {}
 
-        for lease in leases:
-            parts = lease.split()
-            if len(parts) >= 3 and mac_addr.lower() == parts[1].lower():
-                return parts[2]  # Assigned IP
-                
-        logger.debug(f"No lease found for MAC: {mac_addr}")
+        return load_leases(leases_file)
     except Exception as e:
-        logger.error(f"Error reading DHCP leases: {e}")
+        logger.error("Error reading DHCP leases: %s", e)
 
-    return None
+    return {}
 
-def configure_ipmi_bash(dhcp_ip, static_ip, netmask, gateway, username, password, script_path="./ipmi_set_ip.sh"):
-    """Calls an external Bash script to configure IPMI."""
-    if not os.path.exists(script_path):
-        logger.error(f"IPMI configuration script not found: {script_path}")
-        return False
-        
+def find_ipmi_errors(output):
+    """Returns the lines of ipmitool output that report a failed command."""
+    # Closing the session can fail once the BMC has switched to its new
+    # address; that is expected and not a configuration error
+    return [
+        line.strip() for line in output.splitlines()
+        if _IPMI_ERROR_RE.search(line) and "close session" not in line.lower()
+    ]
+
+class _GatewayAliases:
+    """Temporary gateway addresses on the DHCP interface, shared by the workers that need them."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.owned = {}  # gateway -> prefix length it was added with
+        self.lock = threading.Lock()
+
+_gateway_aliases = _GatewayAliases()
+
+def interface_has_address(interface, address):
+    """Returns True if the IPv4 address is already assigned to the interface."""
+    result = subprocess.run(
+        ["ip", "-o", "-4", "addr", "show", "dev", interface],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if "inet" in parts and parts[parts.index("inet") + 1].split("/")[0] == address:
+            return True
+    return False
+
+def acquire_gateway_alias(interface, gateway, netmask):
+    """Adds the gateway address to the interface so a BMC on its new subnet is reachable."""
+    prefix = ipaddress.IPv4Network(f"0.0.0.0/{netmask}").prefixlen
+    with _gateway_aliases.lock:
+        # An address that is already assigned is used as is and left in place
+        if _gateway_aliases.counts[gateway] == 0 and not interface_has_address(interface, gateway):
+            subprocess.run(
+                ["sudo", "ip", "addr", "add", f"{gateway}/{prefix}", "dev", interface],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            _gateway_aliases.owned[gateway] = prefix
+        _gateway_aliases.counts[gateway] += 1
+
+def release_gateway_alias(interface, gateway):
+    """Removes the gateway address once no worker needs it, unless it was there before."""
+    with _gateway_aliases.lock:
+        _gateway_aliases.counts[gateway] -= 1
+        if _gateway_aliases.counts[gateway] == 0 and gateway in _gateway_aliases.owned:
+            # Delete with the prefix the alias was added with, which may differ
+            # from the netmask of the row that releases it last
+            prefix = _gateway_aliases.owned.pop(gateway)
+            subprocess.run(["sudo", "ip", "addr", "del", f"{gateway}/{prefix}", "dev", interface], check=False)
+
+def run_ipmi_shell(host, commands, username, password, timeout=15):
+    """
+    Runs IPMI commands against a BMC in a single ipmitool shell session.
+
+    Returns:
+        list: Error lines reported by ipmitool, empty if all commands succeeded
+    """
+    result = subprocess.run(
+        ["ipmitool", "-I", "lanplus", "-H", host, "-U", username, "-P", password, "shell"],
+        input="".join(f"{command}\n" for command in commands),
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=timeout * len(commands)
+    )
+    logger.debug("IPMI output from %s: %s", host, result.stdout)
+
+    # The shell's exit code only reflects the last command, so check the
+    # output for failures of the earlier ones
+    return find_ipmi_errors(result.stdout + result.stderr)
+
+def reset_bmc(static_ip, username, password, timeout=15):
+    """Warm-resets a BMC through its new static IP so the LAN settings take effect."""
     try:
-        # Make sure the script is executable
-        os.chmod(script_path, 0o755)
-        
-        # Pass the IPMI credentials to the script via environment variables
-        env = os.environ.copy()
-        env["USERNAME"] = username
-        env["PASSWORD"] = password
-        
-        result = subprocess.run(
-            [script_path, dhcp_ip, static_ip, netmask, gateway],
-            env=env,
+        subprocess.run(
+            ["ipmitool", "-I", "lanplus", "-H", static_ip, "-U", username, "-P", password, "mc", "reset", "warm"],
             check=True,
             capture_output=True,
-            text=True
+            text=True,
+            timeout=timeout
         )
-        
-        logger.info(f"Successfully configured IPMI: {static_ip}")
-        logger.debug(f"IPMI configuration output: {result.stdout}")
-        return True
+        logger.info("Reset BMC at %s to apply settings", static_ip)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        logger.warning("BMC reset failed for %s but configuration might still be applied: %s", static_ip, e)
+
+def finish_on_static_ip(interface, static_ip, netmask, gateway, commands, username, password, reset=True,
+                        timeout=15):
+    """
+    Sends the remaining commands and the warm reset to a BMC through its new static IP.
+
+    Returns:
+        list: Error lines reported by ipmitool for the remaining commands
+    """
+    try:
+        acquire_gateway_alias(interface, gateway, netmask)
+    except subprocess.CalledProcessError as e:
+        if commands:
+            raise
+        logger.warning("Could not add gateway %s to %s to reset %s: %s", gateway, interface, static_ip, e.stderr)
+        return []
+
+    try:
+        # Wait for the IP change to apply before talking to the new address
+        time.sleep(5)
+        errors = run_ipmi_shell(static_ip, commands, username, password, timeout) if commands else []
+        if reset and not errors:
+            reset_bmc(static_ip, username, password, timeout)
+        return errors
+    finally:
+        release_gateway_alias(interface, gateway)
+
+def configure_ipmi(dhcp_ip, static_ip, netmask, gateway, username, password, interface, server_ip, reset=True,
+                   timeout=15):
+    """
+    Configures the IPMI LAN settings of a BMC, in a single ipmitool session where possible.
+
+    Args:
+        dhcp_ip (str): Address the BMC obtained from the DHCP pool
+        static_ip (str): Static address to assign
+        netmask (str): Netmask to assign
+        gateway (str): Default gateway to assign
+        username (str): IPMI username
+        password (str): IPMI password
+        interface (str): Local interface the BMCs are reachable on
+        server_ip (str): Address of this host on the interface
+        reset (bool): Warm-reset the BMC through its new address afterwards
+        timeout (float): Seconds allowed per ipmitool command
+
+    Returns:
+        bool: True if all LAN settings were applied
+    """
+    # The netmask can only be set over the DHCP session if this host stays
+    # on-link for the BMC under the new mask; otherwise its replies stop
+    # routing back mid-session and the IP address is never applied. In that
+    # case the netmask and gateway are set through the new address afterwards.
+    # The IP address always goes last: once it changes, the BMC drops the
+    # session that was opened against its DHCP address
+    if ipaddress.ip_address(server_ip) in ipaddress.IPv4Network(f"{dhcp_ip}/{netmask}", strict=False):
+        dhcp_commands = [
+            "lan set 1 ipsrc static",
+            f"lan set 1 netmask {netmask}",
+            f"lan set 1 defgw ipaddr {gateway}",
+            f"lan set 1 ipaddr {static_ip}",
+        ]
+        static_commands = []
+    else:
+        dhcp_commands = ["lan set 1 ipsrc static", f"lan set 1 ipaddr {static_ip}"]
+        static_commands = [f"lan set 1 netmask {netmask}", f"lan set 1 defgw ipaddr {gateway}"]
+
+    try:
+        errors = run_ipmi_shell(dhcp_ip, dhcp_commands, username, password, timeout)
+        if not errors and (static_commands or reset):
+            errors = finish_on_static_ip(interface, static_ip, netmask, gateway, static_commands,
+                                         username, password, reset, timeout)
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to configure IPMI for {static_ip}: {e}")
-        logger.debug(f"Error output: {e.stderr}")
+        logger.error("Failed to configure IPMI for %s: %s", static_ip, e)
+        logger.debug("Error output: %s", e.stderr)
+        return False
+    except subprocess.TimeoutExpired:
+        logger.error("Timed out configuring IPMI for %s via %s", static_ip, dhcp_ip)
         return False
 
-def parse_csv_file(csv_file):
-    """Parse the MAC-to-IP CSV file with validation."""
-    valid_entries = []
-    
+    if errors:
+        logger.error("Failed to configure IPMI for %s: %s", static_ip, "; ".join(errors))
+        return False
+
+    logger.info("Successfully configured IPMI: %s", static_ip)
+    return True
+
+def iter_valid_entries(csv_file):
+    """Parse the MAC-to-IP CSV file with validation, yielding (line number, entry) as they are read."""
     try:
         with open(csv_file, "r") as file:
             reader = csv.reader(file)
@@ -203,12 +398,9 @@ def parse_csv_file(csv_file):
                 logger.error(f"CSV file must have at least 4 columns: MAC, STATIC_IP, NETMASK, GATEWAY. Found: {header}")
                 sys.exit(1)
             
-            line_num = 1
-            for row in reader:
-                line_num += 1
-                
+            for line_num, row in enumerate(reader, start=2):
                 if len(row) < 4:
-                    logger.warning(f"Line {line_num}: Incomplete data: {row}")
+                    logger.warning("Line %d: Incomplete data: %s", line_num, row)
                     continue
                 
                 mac, static_ip, netmask, gateway = row[:4]
@@ -216,29 +408,86 @@ def parse_csv_file(csv_file):
                 # Validate and format MAC address
                 formatted_mac = format_mac_address(mac)
                 if not formatted_mac:
-                    logger.warning(f"Line {line_num}: Invalid MAC address format: {mac}")
+                    logger.warning("Line %d: Invalid MAC address format: %s", line_num, mac)
                     continue
                 
                 # Validate IP addresses
                 if not all(validate_ip_address(ip) for ip in [static_ip, gateway]):
-                    logger.warning(f"Line {line_num}: Invalid IP address in: {row}")
+                    logger.warning("Line %d: Invalid IP address in: %s", line_num, row)
                     continue
                 
                 # Validate netmask
-                try:
-                    ipaddress.IPv4Network(f"0.0.0.0/{netmask}")
-                except ValueError:
-                    logger.warning(f"Line {line_num}: Invalid netmask: {netmask}")
+                if not validate_netmask(netmask):
+                    logger.warning("Line %d: Invalid netmask: %s", line_num, netmask)
                     continue
                 
-                valid_entries.append((formatted_mac, static_ip, netmask, gateway))
-                
-        logger.info(f"Successfully loaded {len(valid_entries)} valid entries from CSV file")
-        return valid_entries
+                yield line_num, (formatted_mac, formatted_mac.lower(), static_ip, netmask, gateway)
     except Exception as e:
         logger.error(f"Error parsing CSV file {csv_file}: {e}")
         sys.exit(1)
 
+def load_valid_entries(csv_file):
+    """
+    Loads the validated CSV entries, dropping repeated devices and addresses.
+
+    Later rows override earlier ones, so a corrected row appended to a merged
+    inventory wins over the stale one.
+
+    Returns:
+        dict: Entries keyed by lowercase MAC address
+    """
+    entries = {}
+    macs_by_ip = {}
+
+    for line_num, entry in iter_valid_entries(csv_file):
+        mac, mac_lower, static_ip = entry[:3]
+
+        if mac_lower in entries:
+            logger.warning("Line %d: Duplicate MAC address %s, overriding previous", line_num, mac)
+            del macs_by_ip[entries.pop(mac_lower)[2]]
+
+        if static_ip in macs_by_ip:
+            previous = entries.pop(macs_by_ip[static_ip])
+            logger.warning("Line %d: Duplicate static IP %s, overriding previous entry for %s",
+                           line_num, static_ip, previous[0])
+
+        entries[mac_lower] = entry
+        macs_by_ip[static_ip] = mac_lower
+
+    logger.info(f"Successfully loaded {len(entries)} valid entries from CSV file")
+    return entries
+
+def iter_leased_entries(pending, leases_file, lease_timeout=25):
+    """
+    Watches the DHCP leases file and yields entries as their devices obtain a lease.
+
+    Args:
+        pending (dict): CSV entries keyed by lowercase MAC; entries are removed as they are yielded
+        leases_file (str): Path to the dnsmasq leases file
+        lease_timeout (float): Seconds to wait for all pending devices
+
+    Yields:
+        tuple: (entry, dhcp_ip) for each device found in the leases file
+    """
+    # Poll with exponential backoff so leases are picked up quickly, while
+    # devices that are slow to boot are retried until the deadline
+    deadline = time.monotonic() + lease_timeout
+    delay = 0.1
+
+    while pending:
+        leases = get_dhcp_leases(leases_file)
+        found = [m for m in pending if m in leases]
+        for mac_lower in found:
+            yield pending.pop(mac_lower), leases[mac_lower]
+
+        remaining = deadline - time.monotonic()
+        if not pending or remaining <= 0:
+            break
+
+        logger.debug("Waiting for DHCP leases for %d devices... (%.0fs left)", len(pending), remaining)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1)
+
 def setup_environment():
     """Check environment and load configuration."""
     if not is_virtual_env():
@@ -255,21 +504,23 @@ def setup_environment():
     config_file = script_dir / "config.yaml"
     csv_file = script_dir / "mac_to_ip.csv"
 
+    # Read the script directory once instead of stat-ing each required file
+    with os.scandir(script_dir) as entries:
+        names = {entry.name for entry in entries}
+
     # Check for config file
-    if not config_file.exists():
+    if config_file.name not in names:
         print("ERROR: Missing configuration file for DHCP pool (config.yaml)")
         sys.exit(1)
 
     # Check for CSV file
-    if not csv_file.exists():
+    if csv_file.name not in names:
         print("ERROR: Missing CSV file: mac_to_ip.csv")
         print("ERROR: Please create a CSV file with MAC-to-IP mappings.")
         sys.exit(1)
         
     # Check for ipmitool
-    try:
-        subprocess.run(["which", "ipmitool"], check=True, stdout=subprocess.PIPE)
-    except subprocess.CalledProcessError:
+    if which("ipmitool") is None:
         print("ERROR: ipmitool is not installed. Please install it with: sudo apt-get install ipmitool")
         sys.exit(1)
         
@@ -299,11 +550,26 @@ def main():
 
     ipmi_user = config["ipmi"]["username"]
     ipmi_pass = config["ipmi"]["password"]
+    ipmi_reset = config["ipmi"].get("reset_bmc", True)
+
+    processing = config.get("processing") or {}
+    max_workers = processing.get("max_workers", 32)
+    lease_timeout = processing.get("lease_timeout", 25)
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        logger.error(f"processing.max_workers must be a positive integer. Found: {max_workers!r}")
+        sys.exit(1)
+
+    if not isinstance(lease_timeout, (int, float)) or isinstance(lease_timeout, bool) or lease_timeout <= 0:
+        logger.error(f"processing.lease_timeout must be a positive number of seconds. Found: {lease_timeout!r}")
+        sys.exit(1)
     
-    # Parse CSV file with validation
-    valid_entries = parse_csv_file(csv_file)
+    # Parse CSV file with validation before touching the network, so a bad
+    # file never leaves the interface or dnsmasq half configured
+    pending = load_valid_entries(csv_file)
+    total = len(pending)
     
-    if not valid_entries:
+    if not pending:
         logger.error("No valid entries found in the CSV file. Exiting.")
         sys.exit(1)
     
@@ -313,34 +579,40 @@ def main():
     # Start the DHCP server
     create_dhcp_pool(interface, dhcp_range_start, dhcp_range_end, subnet_mask, dhcp_config_file)
     
-    # Wait for DHCP to start up
+    # Wait for DHCP to start up; dnsmasq creates the leases file once it is serving
     logger.info("Waiting for DHCP server to initialize...")
-    time.sleep(10)  # Allow DHCP time to start
-
-    # Process each valid entry from the CSV file
-    success_count = 0
-    for mac, static_ip, netmask, gateway in valid_entries:
-        logger.info(f"Looking for IP assigned to MAC: {mac}...")
-
-        dhcp_ip = None
-        attempts = 5  # Retry if IP isn't found immediately
-
-        while attempts > 0:
-            dhcp_ip = get_dhcp_ip(mac, leases_file)
-            if dhcp_ip:
-                break
-            logger.info(f"Waiting for DHCP lease for MAC {mac}... ({attempts} attempts left)")
-            time.sleep(5)
-            attempts -= 1
-
-        if dhcp_ip:
-            logger.info(f"Found {dhcp_ip} for {mac}. Assigning static IP {static_ip}...")
-            if configure_ipmi_bash(dhcp_ip, static_ip, netmask, gateway, ipmi_user, ipmi_pass):
-                success_count += 1
-        else:
-            logger.warning(f"No DHCP IP found for MAC {mac} after multiple attempts. Skipping...")
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and not os.path.exists(leases_file):
+        time.sleep(0.1)
+
+    if not os.path.exists(leases_file):
+        logger.warning("DHCP leases file not found: %s", leases_file)
+
+    # Discovery and configuration run as a pipeline: this thread watches the
+    # leases file and hands each device to the worker pool as soon as it has
+    # a lease, so configuration never waits on a device that is still booting
+    logger.info("Waiting for DHCP leases for %d devices...", total)
+
+    results = Counter()
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        futures = []
+        for (mac, _, static_ip, netmask, bmc_gateway), dhcp_ip in iter_leased_entries(pending, leases_file,
+                                                                                       lease_timeout):
+            logger.info("Found %s for %s. Assigning static IP %s...", dhcp_ip, mac, static_ip)
+            futures.append(executor.submit(configure_ipmi, dhcp_ip, static_ip, netmask, bmc_gateway,
+                                           ipmi_user, ipmi_pass, interface, gateway, ipmi_reset))
+
+        for mac, *_ in pending.values():
+            logger.warning("No DHCP IP found for MAC %s after %ss. Skipping...", mac, lease_timeout)
+
+        for future in as_completed(futures):
+            try:
+                results["success" if future.result() else "failed"] += 1
+            except Exception as e:
+                results["failed"] += 1
+                logger.error("Unexpected error while configuring device: %s", e)
     
-    logger.info(f"IPMI configuration completed. Successfully configured {success_count}/{len(valid_entries)} devices.")
+    logger.info(f"IPMI configuration completed. Successfully configured {results['success']}/{total} devices.")
 
 if __name__ == "__main__":
     main()
@@ -65,9 +65,8 @@ if ! pip show PyYAML &>/dev/null; then
     pip install PyYAML>=6.0
 fi
 
-# Set correct permissions for scripts
-echo "[*] Setting executable permissions on scripts"
-chmod +x ipmi_set_ip.sh
+# Set correct permissions for the script
+echo "[*] Setting executable permissions on IPMIrage.py"
 chmod +x IPMIrage.py
 
 # Create directories for dnsmasq if they don't exist